@@ -4,52 +4,115 @@ Provides functions for setting up logging with different levels, formats and han
 """
 
 import sys
+import queue
+import atexit
 import logging
-import coloredlogs
-from utils import non_empty_check
+import functools
+import threading
+from .utils import non_empty_check
+from typing import Dict, Final
+from logging.handlers import QueueHandler, QueueListener
 
 
+_LEVELS: Final[Dict[str, int]] = {
+    "info": logging.INFO,
+    "debug": logging.DEBUG,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+_LOG_FORMAT: Final[str] = "%(levelname)s - %(asctime)s - %(filename)s: %(lineno)d - %(message)s"
+
+# Loggers only enqueue records; a single background listener owns the console
+# handler, so worker threads never block on stdout writes.
+_log_queue: queue.Queue = queue.Queue(-1)
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+_listener = QueueListener(_log_queue, _console_handler)
+# Serializes the first setup_logger() calls, so the listener starts exactly once.
+_console_lock = threading.Lock()
+_console_started = False
+
+# Configured once: repeated null_logger() calls must not stack handlers, and
+# records must not reach root handlers.
+_NULL_LOGGER = logging.getLogger("fastarxiv.null")
+_NULL_LOGGER.addHandler(logging.NullHandler())
+_NULL_LOGGER.propagate = False
+_NULL_LOGGER.setLevel(logging.CRITICAL + 1)
+
+
+@functools.lru_cache(maxsize=16)
 def set_level(log_level: str):
     """
     Convert string log level to logging constant.
 
-    :param log_level: String representation of log level (info, debug, warning, error, exception)
+    :param log_level: String representation of log level (info, debug, warning, error, exception, critical)
     :returns: Logging level constant
     :raises:
         TypeError: If log_level is not string
         ValueError: If log_level is empty
     """
     non_empty_check(variable=log_level, expected_type=str, variable_name="log level")
-    log_level = log_level.lower()
-
-    if "info" in log_level:
-        return logging.INFO
-    elif "deb" in log_level:
-        return logging.DEBUG
-    elif "warn" in log_level:
-        return logging.WARNING
-    elif "err" in log_level:
-        return logging.ERROR
-    elif "exc" in log_level:
-        return logging.EXCEPTION
-    else:
-        return logging.INFO
+    log_level = log_level.strip().lower()
+
+    level = _LEVELS.get(log_level)
+    if level is not None:
+        return level
+    # Accept abbreviations such as "deb", "warn" or "err".
+    if log_level:
+        for name, level in _LEVELS.items():
+            if name.startswith(log_level):
+                return level
+    return logging.INFO
+
+
+def _start_console() -> None:
+    """
+    Start the console listener on first use, with colors if coloredlogs is installed
+    and stdout is a terminal. Deferred so that processes using only the null logger
+    never import coloredlogs or start the listener thread. Safe to call from
+    several threads at once.
+    """
+    global _console_started
+    if _console_started:
+        return
+    with _console_lock:
+        if _console_started:
+            return
+        _configure_console()
+        _listener.start()
+        atexit.register(_listener.stop)
+        _console_started = True
+
+
+def _configure_console() -> None:
+    """
+    Install the colored formatter on the console handler when supported.
+    """
+    try:
+        import coloredlogs
+
+        # Redirected output (files, pipes, CI logs) keeps the plain formatter.
+        if coloredlogs.terminal_supports_colors(sys.stdout):
+            _console_handler.setFormatter(coloredlogs.ColoredFormatter(_LOG_FORMAT))
+    except ImportError:
+        pass
 
 
 def null_logger():
     """
-    Create a logger that suppresses all output.
+    Return the shared logger that suppresses all output.
 
-    :returns: Logger with NullHandler
+    :returns: Logger with NullHandler, disabled levels and no propagation
     """
-    null_logger = logging.getLogger("null_logger")
-    null_logger.addHandler(logging.NullHandler())
-    return null_logger
+    return _NULL_LOGGER
 
 
 def setup_logger(name: str, log_level: str = "INFO"):
     """
-    Configure and return a logger with console output and colored formatting.
+    Configure and return a logger with queued console output and colored formatting.
 
     :param name: Name for the logger instance
     :param log_level: Logging level (info, debug, warning, error, exception)
@@ -59,22 +122,19 @@ def setup_logger(name: str, log_level: str = "INFO"):
         ValueError: If name is empty
 
     Features:
-        - Colored output using coloredlogs
-        - Console handler writing to stdout
+        - Colored output using coloredlogs on terminals, plain output when redirected
+          or if it is not installed
+        - QueueHandler on the logger, console output written by a background listener
         - Formatted output with level, timestamp, file, line number
         - Prevents duplicate handlers
+        - Leaves the root logger untouched
     """
     non_empty_check(variable=name, expected_type=str, variable_name="logger name")
+    _start_console()
     logger = logging.getLogger(name)
+    # The level lives on the logger only, so calling again just updates it.
     logger.setLevel(set_level(log_level))
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(set_level(log_level))
-    formatter = logging.Formatter(
-        "%(levelname)s - %(asctime)s - %(filename)s: %(lineno)d - %(message)s"
-    )
-    console_handler.setFormatter(formatter)
-    coloredlogs.install(level="DEBUG")
-    coloredlogs.install(level="DEBUG", logger=logger)
-    if not logger.hasHandlers():
-        logger.addHandler(console_handler)
+    if not logger.handlers:
+        logger.addHandler(QueueHandler(_log_queue))
+        logger.propagate = False
     return logger
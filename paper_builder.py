@@ -6,7 +6,7 @@ Components:
     - SortBy: Enum for result sorting options (relevance, date)
     - SortOrder: Enum for sort direction (asc/desc)
     - Area: Enum for search areas (title, author, abstract, etc.)
-    - Query: Pydantic model for building validated query strings
+    - Query: Frozen dataclass for building validated query strings
 
 Example:
     >>> query = Query(
@@ -16,16 +16,26 @@ Example:
     ...     sort_by=SortBy.relevance
     ... )
     >>> query.build()
-    'search_query=ti:machine learning&start=0&max_results=5&sort_by=relevance&sort_order=descending'
+    'search_query=ti:machine%20learning&start=0&max_results=5&sort_by=relevance&sort_order=descending'
+
+    arXiv query syntax ('+' separators, field prefixes, grouping) is kept as is:
+    >>> Query(search_query="electron+AND+ti:proton").build()
+    'search_query=all:electron+AND+ti:proton&start=0&max_results=1&sort_by=relevance&sort_order=descending'
+
+    Already percent-encoded queries, as written in the arXiv API manual, are not encoded twice:
+    >>> Query(search_query="%22electron%20thermal%20conductivity%22", area="ti").build()
+    'search_query=ti:%22electron%20thermal%20conductivity%22&start=0&max_results=1&sort_by=relevance&sort_order=descending'
 
 Dependencies:
-    - pydantic: For data validation
+    - pydantic: For validating untrusted input (Query.from_untrusted)
     - enum: For enumerated types
 """
 
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, PositiveInt, Field, field_validator
+from functools import lru_cache
+from urllib.parse import quote
+from dataclasses import dataclass, field
+from typing import Any, Dict, Final, FrozenSet, Optional
 
 
 class SortBy(str, Enum):
@@ -41,9 +51,9 @@ class SortBy(str, Enum):
     lastUpdatedDate = "lastUpdatedDate"
 
     @classmethod
-    def values(cls):
-        """Return a list of all values in the SortBy enum."""
-        return list(cls.__members__.values())
+    def values(cls) -> FrozenSet[str]:
+        """Return the precomputed set of all values in the SortBy enum."""
+        return _SORT_BY_VALUES
 
 
 class SortOrder(str, Enum):
@@ -57,9 +67,9 @@ class SortOrder(str, Enum):
     descending = "descending"
 
     @classmethod
-    def values(cls):
-        """Return a list of all values in the SortOrder enum."""
-        return list(cls.__members__.values())
+    def values(cls) -> FrozenSet[str]:
+        """Return the precomputed set of all values in the SortOrder enum."""
+        return _SORT_ORDER_VALUES
 
 
 class Area(str, Enum):
@@ -87,14 +97,40 @@ class Area(str, Enum):
     idlist = "id_list"
 
     @classmethod
-    def values(cls):
-        """Return a list of all values in the Area enum."""
-        return list(cls.__members__.values())
+    def values(cls) -> FrozenSet[str]:
+        """Return the precomputed set of all values in the Area enum."""
+        return _AREA_VALUES
+
 
+def _enum_value(value: Any) -> Any:
+    """
+    Unwrap enum members to their raw value.
 
-class Query(BaseModel):
+    :param value: Enum member or plain value
+    :returns: Enum value if an enum member was given, otherwise the input
+    """
+    return value.value if isinstance(value, Enum) else value
+
+
+_AREA_VALUES: Final[FrozenSet[str]] = frozenset(area.value for area in Area)
+_SORT_BY_VALUES: Final[FrozenSet[str]] = frozenset(sort.value for sort in SortBy)
+_SORT_ORDER_VALUES: Final[FrozenSet[str]] = frozenset(
+    order.value for order in SortOrder
+)
+_QUERY_SAFE_CHARS: Final[str] = '+:()"%'
+_SORT_ORDER_ALIASES: Final[Dict[str, str]] = {
+    SortOrder.ascending.value: SortOrder.ascending.value,
+    SortOrder.descending.value: SortOrder.descending.value,
+    "asc": SortOrder.ascending.value,
+    "desc": SortOrder.descending.value,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Query:
     """
     Model for building and validating arXiv API queries.
+    Validation runs once in __post_init__ against precomputed value sets.
     :ivar search_query: (str) Main search terms.
     :ivar area: (Area) Search area to query.
     :ivar id_list: (List[int]) Comma-separated list of arXiv IDs.
@@ -105,77 +141,104 @@ class Query(BaseModel):
     """
 
     search_query: str
-    area: Optional[str] = Field(
-        default=Area.all_.value,
-        description="Narrowed down search area, e.g. 'author', 'list_id', etc.",
-    )
-    id_list: Optional[str] = Field(default=None, description="Comma-delimited string")
-    start: PositiveInt = Field(default=0, ge=0)
-    max_results: PositiveInt = Field(default=1, ge=1)
-    sort_by: Optional[str] = Field(
-        default="relevance",
-        description="Sort by relevance, submission date or last update date",
-    )
-    sort_order: Optional[str] = Field(
-        default="descending", description="Order of sorting: ascending or descending"
-    )
-
-    def build(self) -> str:
+    area: Optional[str] = Area.all_.value
+    id_list: Optional[str] = None
+    start: int = 0
+    max_results: int = 1
+    sort_by: Optional[str] = SortBy.relevance.value
+    sort_order: Optional[str] = SortOrder.descending.value
+    _query: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
         """
-        Build a query string based on the instance attributes.
-        :returns: Formatted query string for arXiv API
+        Validate and normalize query fields.
+        :raises ValueError: If any field holds an unsupported value
         """
-        return (
-            f"search_query={self.area}:{self.search_query}&"
+        if not isinstance(self.search_query, str) or len(self.search_query) <= 1:
+            raise ValueError("search_query must be longer than 1 character")
+
+        area = _enum_value(self.area)
+        if area not in _AREA_VALUES:
+            raise ValueError(
+                f"Error in 'Area': must be in '{', '.join(a.value for a in Area)}', not: (input: '{area}')"
+            )
+
+        if not isinstance(self.start, int) or self.start < 0:
+            raise ValueError(f"start must be an integer >= 0, not: (input: '{self.start}')")
+        if not isinstance(self.max_results, int) or self.max_results < 1:
+            raise ValueError(
+                f"max_results must be an integer >= 1, not: (input: '{self.max_results}')"
+            )
+
+        sort_by = _enum_value(self.sort_by)
+        if sort_by not in _SORT_BY_VALUES:
+            raise ValueError(
+                f"Error in 'sort_by': must be either 'relevance', 'submittedDate' or 'lastUpdatedDate', not: (input: '{sort_by}')"
+            )
+
+        sort_order = _enum_value(self.sort_order)
+        if sort_order not in _SORT_ORDER_VALUES:
+            # Slow path only for other spellings, e.g. "DESC" or "Ascending".
+            raw_sort_order = sort_order
+            sort_order = (
+                _SORT_ORDER_ALIASES.get(sort_order.lower())
+                if isinstance(sort_order, str)
+                else None
+            )
+            if sort_order is None:
+                raise ValueError(
+                    f"Error in 'sort_order': must be either 'ascending' or 'descending', not: (input: '{raw_sort_order}')"
+                )
+
+        # Only rewrite fields that were normalized (enum member or other case).
+        if area is not self.area:
+            object.__setattr__(self, "area", area)
+        if sort_by is not self.sort_by:
+            object.__setattr__(self, "sort_by", sort_by)
+        if sort_order is not self.sort_order:
+            object.__setattr__(self, "sort_order", sort_order)
+        # Instances are immutable, so the query string is built exactly once.
+        # '+', ':', parentheses and quotes are arXiv query syntax and must not be escaped;
+        # '%' is kept so that already percent-encoded queries are not encoded twice.
+        object.__setattr__(
+            self,
+            "_query",
+            f"search_query={area}:{quote(self.search_query, safe=_QUERY_SAFE_CHARS)}&"
             f"start={self.start}&"
             f"max_results={self.max_results}&"
-            f"sort_by={self.sort_by}&"
-            f"sort_order={self.sort_order}"
+            f"sort_by={sort_by}&"
+            f"sort_order={sort_order}",
         )
 
-    @field_validator("area")
-    def validate_area(cls, value):
-        """
-        Validate search area value.
-        :raises ValueError: If value not in Area enum
+    @classmethod
+    def from_untrusted(cls, **kwargs: Any) -> "Query":
         """
-        if value not in Area.values:
-            raise ValueError(
-                f"Error in 'Area': must be in '{', '.join([x for x in Area.values])}', not: (input: '{value}')"
-            )
-        return value
+        Build a query from external input (e.g. parsed JSON, CLI arguments).
+        Runs full pydantic validation with type coercion before __post_init__.
+        Internal callers should use the plain constructor instead.
 
-    @field_validator("search_query")
-    def check_length(cls, value):
+        :param kwargs: Raw query fields
+        :returns: Validated Query instance
+        :raises pydantic.ValidationError: If input cannot be validated
         """
-        Validate search query length.
-        :raises ValueError: If query length <= 1
-        """
-        if len(value) <= 1:
-            raise ValueError("search_query must be longer than 1 character")
-        return value
+        return _query_adapter().validate_python(kwargs)
 
-    @field_validator("sort_by")
-    def validate_sort_by(cls, value):
+    def build(self) -> str:
         """
-        Validate sort_by value.
-        :raises ValueError: If value not in SortBy enum
+        Build a query string based on the instance attributes.
+        :returns: Formatted query string for arXiv API, cached at construction
         """
-        if value not in SortBy.values:
-            raise ValueError(
-                f"Error in 'sort_by': must be either 'relevance', 'submittedDate' or 'lastUpdatedDate', not: (input: '{value}')"
-            )
-        return value
+        return self._query
 
-    @field_validator("sort_order")
-    def validate_sort_order(cls, value):
-        """
-        Validate sort order value.
-        :raises ValueError: If value not in SortOrder enum
-        """
-        value = value.lower() if value else value
-        if value not in SortOrder.values:
-            raise ValueError(
-                f"Error in 'sort_order': must be either 'ascending' or 'descending', not: (input: '{value}')"
-            )
-        return value
+
+@lru_cache(maxsize=1)
+def _query_adapter():
+    """
+    Create the pydantic adapter for Query on first use.
+    Keeps pydantic off the import path for callers that never need it.
+
+    :returns: pydantic.TypeAdapter bound to Query
+    """
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(Query)
@@ -5,7 +5,8 @@ This module provides a client for interacting with the arXiv API to search, down
 and process academic papers. 
 
 Features include:
-- Concurrent paper downloads using thread pools
+- Concurrent API queries using asyncio
+- Concurrent paper downloads using asyncio, with thread pools for blocking callers
 - Configurable logging
 - PDF content extraction
 - Metadata parsing and cleaning
@@ -14,13 +15,15 @@ Features include:
 
 Example:
     >>> from papers import Arxiv
-    >>> client = Arxiv(logger=True)
-    >>> client.get_papers([
-    ...     Query(search_query="machine learning", max_results=5)
-    ... ])
+    >>> with Arxiv(logger=True) as client:
+    ...     client.download_papers([
+    ...         Query(search_query="machine learning", max_results=5)
+    ...     ])
 
 Dependencies:
     - httpx: For HTTP requests
+    - orjson: For fast JSON serialization
+    - asyncio: For concurrent API queries
     - concurrent.futures: For concurrent downloads
     - custom_logger: For logging configuration
     - utils: For helper functions
@@ -31,23 +34,32 @@ Version: 1.0.0
 """
 
 import os
-import json
+import queue
+import orjson
 import httpx
+import asyncio
 import logging
+import weakref
+import threading
 from .paper_builder import Query
-from concurrent.futures import wait
-from .custom_exceptions import PaperGeneralError
+from concurrent.futures import Future, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from .custom_exceptions import PaperGeneralError, PDFDownloadError
 from concurrent.futures import ThreadPoolExecutor
 from .custom_logger import setup_logger, null_logger
-from typing import Any, AsyncGenerator, Dict, Final, Optional, List
+from typing import Any, AsyncGenerator, Dict, Final, Optional, List, Tuple
 
 from .utils import (
     clean_text,
     check_path,
-    xml_to_dict,
+    parse_arxiv_feed,
+    load_cache_index,
+    append_cache_index,
+    run_coroutine,
     save_to_file,
     extract_links,
     load_pdf_text,
+    extract_pdf_text,
     extract_authors,
     extract_category,
     extract_primary_category,
@@ -57,7 +69,21 @@ logging.getLogger("httpx").setLevel(logging.ERROR)
 logging.getLogger("httpcore").setLevel(logging.ERROR)
 
 DEFAULT_MAX_WORKERS: int = 10
+DEFAULT_TIMEOUT: float = 30.0
+DEFAULT_WRITE_QUEUE_SIZE: int = 256
 DEFAULT_BASE_URL: str = "http://export.arxiv.org/api/query?"
+PAPER_KEYS: Final[Tuple[str, ...]] = (
+    "id",
+    "updated",
+    "published",
+    "title",
+    "summary",
+    "author",
+    "links",
+    "category",
+    "primary_category",
+    "content",
+)
 
 
 class Arxiv:
@@ -66,11 +92,18 @@ class Arxiv:
     Provides methods for searching, downloading and processing arXiv papers.
     Handles concurrent downloads, logging, and file management.
 
-    :ivar client: (httpx.Client) HTTP client for API requests.
+    :ivar client: (httpx.Client) Pooled HTTP client for API requests (HTTP/2 when served over https).
+    :ivar limits: (httpx.Limits) Connection pool limits derived from max_workers.
+    :ivar pdf_client: (httpx.Client) Pooled HTTP client shared by all PDF downloads.
     :ivar base_url: (str) Base URL for arXiv API.
     :ivar download_path: (str) Path for saving downloaded papers.
+    :ivar cached_ids: (dict) arXiv ids of papers saved in download_path, mapped to their file names.
     :ivar logger (bool | logging.Logger): Logger instance for tracking operations.
-    :ivar executor: Thread pool for concurrent operations.
+    :ivar executor: Thread pool for parsing API responses and dispatching their entries.
+    :ivar pdf_executor: Larger thread pool for blocking PDF downloads and text extraction.
+    :ivar download_limit: (int) Concurrent PDF downloads of download_papers.
+    :ivar query_timeout: (float | None) Time limit for the downloads of a single query.
+    :ivar max_failures: (int | None) Failed downloads tolerated per query.
     """
 
     def __init__(
@@ -79,7 +112,9 @@ class Arxiv:
         base_url: Optional[str] = DEFAULT_BASE_URL,
         logger: Optional[bool | logging.Logger] = False,
         max_workers: Optional[int] = DEFAULT_MAX_WORKERS,
-        download_path: Optional[str] = None
+        download_path: Optional[str] = None,
+        query_timeout: Optional[float] = None,
+        max_failures: Optional[int] = None,
     ):
         # Use the walrus operator to assign and check download_path
         """
@@ -88,17 +123,43 @@ class Arxiv:
         :param log_level: Logging level (debug, info, warning, error, critical)
         :param base_url: arXiv API base URL
         :param logger: Custom logger, True for default logger, or False for null logger
-        :param max_workers: Maximum number of concurrent download threads
+        :param max_workers: Number of response parsing threads; up to twice as many PDFs are downloaded at once
         :param download_path: Directory path for saving downloaded papers
+        :param query_timeout: Seconds to wait for all downloads of one query, no limit if None
+        :param max_failures: Failed downloads tolerated per query before aborting it, no limit if None
         :raises OSError: If download path creation fails
         """
 
-        self.client = httpx.Client()
+        max_workers = max_workers or DEFAULT_MAX_WORKERS
+        self.limits = httpx.Limits(
+            max_connections=max_workers * 2, max_keepalive_connections=max_workers
+        )
+        self.client = httpx.Client(http2=True, limits=self.limits, timeout=DEFAULT_TIMEOUT)
+        # Sized for pdf_executor, so every download thread can hold a connection.
+        self.pdf_client = httpx.Client(
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_workers * 2, max_keepalive_connections=max_workers * 2
+            ),
+            timeout=DEFAULT_TIMEOUT,
+        )
         self.base_url: Final[str] = base_url
         self.download_path = check_path(download_path) if download_path else check_path("ArxivPapers")
+        self.cached_ids = load_cache_index(self.download_path)
+        self.__cache_lock = threading.Lock()
+        self.download_limit = max_workers * 2
+        self.query_timeout = query_timeout
+        self.max_failures = max_failures
         self.log_level = (log_level,)
         self.logger = self.__setup_logger(logger, log_level)
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.pdf_executor = ThreadPoolExecutor(max_workers=max_workers * 2)
+        self.__write_queue: queue.Queue = queue.Queue(maxsize=DEFAULT_WRITE_QUEUE_SIZE)
+        # Started on the first queued paper, see __queue_paper.
+        self.__writer: Optional[threading.Thread] = None
+        self.__stop_writer: Optional[weakref.finalize] = None
+        self.__writer_lock = threading.Lock()
 
     def __setup_logger(
         self, logger: Optional[bool | logging.Logger], log_level: str
@@ -127,44 +188,32 @@ class Arxiv:
         if not links:
             self.logger.debug("No links found.")
             return None
-        for link in links:
-            if "/pdf" in link["href"]:
-                return link["href"]
-        self.logger.warning(f"Missing 'pdf' in links: {links}")
-        return None
+        href = next(
+            (link["href"] for link in links if link and "/pdf" in (link["href"] or "")),
+            None,
+        )
+        if href is None and self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning("Missing 'pdf' in links: %r", links)
+        return href
 
     def get(self, arxiv_data: dict) -> dict:
         """
         Get cleaned paper metadata with standard structure.
 
         :param arxiv_data: Raw arXiv paper metadata
-        :returns: Dictionary with standardized paper metadata
-        :raises KeyError: If required metadata fields are missing
+        :returns: Dictionary with standardized paper metadata, None for missing fields
         """
-        try:
-            return {
-                "id": arxiv_data.get("id", None),
-                "updated": arxiv_data.get("updated", None),
-                "published": arxiv_data.get("published", None),
-                "title": arxiv_data.get("title", None),
-                "summary": arxiv_data.get("summary", None),
-                "author": arxiv_data.get("author", None),
-                "links": arxiv_data.get("links", None),
-                "category": arxiv_data.get("category", None),
-                "primary_category": arxiv_data.get("primary_category", None),
-                "content": arxiv_data.get("content", None),
-            }
-        except KeyError as e:
-            raise KeyError(f"Missing key in dict data: {e}")
+        return {key: arxiv_data.get(key) for key in PAPER_KEYS}
 
     def __get_raw(self, arxiv_data: dict) -> dict:
         """
         Extract and clean raw arXiv metadata fields.
 
         :param arxiv_data: Raw XML-parsed arXiv metadata
-        :returns: Dictionary with cleaned metadata fields
+        :returns: Dictionary in the final paper structure, with "content" set to None
         :raises KeyError: If required raw data fields are missing
-        :note: Private method for internal metadata processing
+        :note: Only needed for items parsed with xml_to_dict, as passed to process_item;
+            feeds fetched by the client are read with parse_arxiv_feed
         """
         try:
             return {
@@ -179,10 +228,188 @@ class Arxiv:
                 "primary_category": extract_primary_category(
                     arxiv_data.get("primary_category", None)
                 ),
+                "content": None,
             }
         except KeyError as e:
             raise KeyError(f"Missing key in raw data: {e}")
 
+    def __prepare_item(
+        self, item_summary: dict, overwrite: Optional[bool] = False
+    ) -> Optional[Tuple[dict, str]]:
+        """
+        Extract the PDF link of a single arXiv paper.
+
+        :param item_summary: Paper metadata as yielded by parse_arxiv_feed
+        :param overwrite: Whether to process papers that were already saved
+        :returns: Tuple of paper metadata and PDF link, or None if the paper
+            is already saved or no PDF link was found
+        :logs: Debug if paper is cached, warning if PDF link not found
+        """
+        if not overwrite and self.__is_saved(item_summary["id"]):
+            self.logger.debug("Skipping already saved paper %s", item_summary["id"])
+            return None
+
+        pdf_link = self.extract_pdf_link(item_summary.get("links"))
+
+        if not pdf_link:
+            self.logger.warning(
+                "No pdf link. File not downloadable for %s", item_summary["title"]
+            )
+            return None
+        return item_summary, pdf_link
+
+    def __is_saved(self, paper_id: Optional[str]) -> bool:
+        """
+        Check whether a paper is listed in the cache index and its file still exists.
+
+        :param paper_id: arXiv id of the paper
+        :returns: True if the saved file is present in download_path
+        :note: Papers whose file was deleted are downloaded again
+        """
+        file_name = self.cached_ids.get(paper_id)
+        return file_name is not None and (self.download_path / file_name).is_file()
+
+    def __write_paper(self, item_summary: dict, overwrite: Optional[bool] = False) -> None:
+        """
+        Save paper to a JSON file and record it in the cache index.
+
+        :param item_summary: Paper metadata with content
+        :param overwrite: Whether to overwrite existing files
+        :raises OSError: If the file or cache index cannot be written
+        """
+        file_path = save_to_file(
+            item_summary, item_summary["title"], add_timestamp=overwrite, path=self.download_path
+        )
+        if item_summary["id"]:
+            with self.__cache_lock:
+                # Timestamped copies are only recorded if the listed file is gone.
+                if not self.__is_saved(item_summary["id"]):
+                    append_cache_index(self.download_path, item_summary["id"], file_path.name)
+                    self.cached_ids[item_summary["id"]] = file_path.name
+
+    @staticmethod
+    def __writer_loop(
+        tasks: queue.Queue, write_paper: weakref.WeakMethod, logger: logging.Logger
+    ) -> None:
+        """
+        Write queued papers to disk until the None sentinel is received.
+        Runs on the dedicated writer thread. Only holds a weak reference to the client,
+        so an unclosed client can still be collected; its finalizer sends the sentinel.
+
+        :param tasks: Write queue of the client
+        :param write_paper: Weak reference to the client's __write_paper
+        :param logger: Logger of the client
+        :logs: Error if a paper cannot be saved
+        """
+        while True:
+            task = tasks.get()
+            try:
+                if task is None:
+                    return
+                # Resolved per task, so no strong reference is kept while waiting.
+                write = write_paper()
+                if write is None:
+                    return
+                write(*task)
+                del write
+            except Exception as e:
+                logger.error("Error saving paper: %s", e)
+            finally:
+                tasks.task_done()
+
+    def __queue_paper(self, item_summary: dict, overwrite: Optional[bool] = False) -> None:
+        """
+        Queue a downloaded paper for the writer thread, starting the thread if needed.
+
+        :param item_summary: Paper metadata with content
+        :param overwrite: Whether to overwrite existing files
+        """
+        with self.__writer_lock:
+            if self.__writer is None or not self.__writer.is_alive():
+                self.__writer = threading.Thread(
+                    target=self.__writer_loop,
+                    args=(self.__write_queue, weakref.WeakMethod(self.__write_paper), self.logger),
+                    name="arxiv-writer",
+                    daemon=True,
+                )
+                self.__writer.start()
+                self.__stop_writer = weakref.finalize(self, self.__write_queue.put, None)
+        self.__write_queue.put((item_summary, overwrite))
+
+    def __load_content(self, item_summary: dict, pdf_link: str) -> dict:
+        """
+        Download the PDF of prepared paper metadata and add its text as "content".
+        Blocking; shared by process_item, __download_paper and read_papers.
+
+        :param item_summary: Paper metadata returned by __prepare_item
+        :param pdf_link: URL of the paper PDF
+        :returns: The same metadata dictionary, with content
+        :raises PDFDownloadError: If the download or text extraction fails
+        """
+        item_summary["content"] = load_pdf_text(pdf_link, client=self.pdf_client, normalize=True)
+        return item_summary
+
+    def __download_paper(
+        self, item_summary: dict, pdf_link: str, overwrite: Optional[bool] = False
+    ) -> None:
+        """
+        Download PDF content for prepared paper metadata and queue it for saving.
+
+        :param item_summary: Paper metadata returned by __prepare_item
+        :param pdf_link: URL of the paper PDF
+        :param overwrite: Whether to overwrite existing files
+        """
+        self.__queue_paper(self.__load_content(item_summary, pdf_link), overwrite)
+
+    def __store_paper(
+        self, item_summary: dict, pdf_data: bytes, pdf_link: str, overwrite: Optional[bool] = False
+    ) -> None:
+        """
+        Extract text from downloaded PDF bytes and queue the paper for saving.
+
+        :param item_summary: Paper metadata returned by __prepare_item
+        :param pdf_data: Raw PDF document
+        :param pdf_link: URL the PDF was downloaded from
+        :param overwrite: Whether to overwrite existing files
+        :raises PDFDownloadError: If the PDF cannot be parsed
+        """
+        item_summary["content"] = extract_pdf_text(pdf_data, pdf_link, normalize=True)
+        self.__queue_paper(item_summary, overwrite)
+
+    async def __download_paper_async(
+        self,
+        client: httpx.AsyncClient,
+        slots: asyncio.Semaphore,
+        item_summary: dict,
+        pdf_link: str,
+        overwrite: Optional[bool] = False,
+    ) -> None:
+        """
+        Download a paper PDF on the event loop and queue it for saving.
+
+        :param client: Shared async HTTP client
+        :param slots: Semaphore bounding concurrent downloads
+        :param item_summary: Paper metadata returned by __prepare_item
+        :param pdf_link: URL of the paper PDF
+        :param overwrite: Whether to overwrite existing files
+        :raises PDFDownloadError: If the download or text extraction fails
+        :note: Text extraction is CPU-bound and runs on pdf_executor
+        """
+        async with slots:
+            try:
+                response = await client.get(pdf_link, follow_redirects=True)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                raise PDFDownloadError(f"HTTP error downloading PDF from {pdf_link}: {e}")
+            await asyncio.get_running_loop().run_in_executor(
+                self.pdf_executor,
+                self.__store_paper,
+                item_summary,
+                response.content,
+                pdf_link,
+                overwrite,
+            )
+
     def process_item(self, item: dict, overwrite: Optional[bool] = False) -> None:
         """
         Process single arXiv paper item - extract metadata and download PDF.
@@ -191,18 +418,91 @@ class Arxiv:
         :param overwrite: Whether to overwrite existing files
         :logs: Warning if PDF link not found
         """
-        item_summary = self.__get_raw(item)
-        pdf_link = self.extract_pdf_link(item_summary.get("links"))
+        prepared = self.__prepare_item(self.__get_raw(item), overwrite)
+        if prepared:
+            self.__write_paper(self.__load_content(*prepared), overwrite)
 
-        if pdf_link:
-            item_summary["content"] = clean_text(load_pdf_text(pdf_link))
-            save_to_file(
-                self.get(item_summary), item_summary["title"], add_timestamp=overwrite, path=self.download_path
-            )
-        else:
-            self.logger.warning(
-                f"No pdf link. File not downloadable for {item_summary['title']}"
-            )
+    def __process_entries(
+        self, xml_data: str | bytes, overwrite: Optional[bool] = False
+    ) -> None:
+        """
+        Parse an arXiv API response and download its papers concurrently.
+        Metadata is extracted in the calling thread, PDF downloads run on pdf_executor
+        and files are written by the writer thread. Returns once all files are written.
+
+        :param xml_data: Raw Atom feed returned by the arXiv API
+        :param overwrite: Whether to overwrite existing files
+        :logs: Error for failed processing, warning if no content
+        """
+        futures = []
+        found_entries = False
+        try:
+            # Entries are submitted as soon as they are parsed, so downloads
+            # start while the rest of the feed is still being read.
+            for item in parse_arxiv_feed(xml_data):
+                found_entries = True
+                try:
+                    prepared = self.__prepare_item(item, overwrite)
+                except Exception as e:
+                    self.logger.error("Error processing item: %s", e)
+                    continue
+                if prepared:
+                    futures.append(
+                        self.pdf_executor.submit(self.__download_paper, *prepared, overwrite)
+                    )
+        finally:
+            self.__collect(futures)
+
+        if not found_entries:
+            self.logger.warning("No PDF content to extract")
+
+    def __record_failure(self, failures: int, exception: BaseException) -> int:
+        """
+        Log a failed download and apply the max_failures policy of a query.
+        Shared by __collect and __collect_async.
+
+        :param failures: Failed downloads of the query so far
+        :param exception: Error raised by the failed download
+        :returns: Updated number of failed downloads
+        :raises PaperGeneralError: If more than max_failures downloads failed
+        :logs: Error for the failed download
+        """
+        failures += 1
+        self.logger.error("Error processing item: %s", exception)
+        if self.max_failures is not None and failures > self.max_failures:
+            raise PaperGeneralError(f"Aborting query after {failures} failed downloads")
+        return failures
+
+    def __timeout_error(self) -> PaperGeneralError:
+        """
+        Build the error raised when the downloads of a query exceed query_timeout.
+        """
+        return PaperGeneralError(
+            f"Downloads did not finish within {self.query_timeout} seconds"
+        )
+
+    def __collect(self, futures: List[Future]) -> None:
+        """
+        Wait for download futures, logging each failure as soon as it completes.
+        Pending downloads are cancelled when the query is aborted.
+
+        :param futures: Futures returned by pdf_executor
+        :raises PaperGeneralError: If downloads exceed query_timeout or more than max_failures fail
+        :logs: Error for each failed download
+        """
+        failures = 0
+        try:
+            for future in as_completed(futures, timeout=self.query_timeout):
+                exception = future.exception()
+                if exception is not None:
+                    failures = self.__record_failure(failures, exception)
+        except FuturesTimeoutError:
+            raise self.__timeout_error()
+        finally:
+            # No-op for finished futures; drops queued downloads after an abort.
+            for future in futures:
+                future.cancel()
+            self.flush()
 
     def fetch_and_process(
         self, query: Query, overwrite: Optional[bool] = False
@@ -213,45 +513,166 @@ class Arxiv:
         :param query: Query parameters for arXiv API
         :param overwrite: Whether to overwrite existing files
         :raises httpx.HTTPError: If API request fails
+        :raises PaperGeneralError: If downloads time out or fail too often
         :logs: Error for failed processing, warning if no content
         """
         response = self.client.get(f"{self.base_url}{query.build()}")
         response.raise_for_status()
-        embedded_data = xml_to_dict(response.text)
+        self.__process_entries(response.content, overwrite)
 
-        if "entry" in embedded_data.keys():
-            embedded_data = embedded_data.get("entry")
-            futures = [
-                self.executor.submit(self.process_item, item)
-                for item in embedded_data
-            ]
-            done, _ = wait(futures)
-            for future in done:
-                if future.exception():
-                    self.logger.error(f"Error processing item: {future.exception()}")
-        else:
+    async def __fetch_query(
+        self,
+        client: httpx.AsyncClient,
+        slots: asyncio.Semaphore,
+        query: Query,
+        overwrite: Optional[bool] = False,
+    ) -> None:
+        """
+        Fetch a single query asynchronously and download its papers on the event loop.
+
+        :param client: Shared async HTTP client
+        :param slots: Semaphore bounding concurrent PDF downloads
+        :param query: Query parameters for arXiv API
+        :param overwrite: Whether to overwrite existing files
+        :raises httpx.HTTPError: If API request fails
+        :raises PaperGeneralError: If downloads time out or fail too often
+        :logs: Error for failed processing, warning if no content
+        :note: Feed parsing runs on executor, off the event loop
+        """
+        response = await client.get(f"{self.base_url}{query.build()}")
+        response.raise_for_status()
+        entries = await asyncio.get_running_loop().run_in_executor(
+            self.executor, list, parse_arxiv_feed(response.content)
+        )
+        if not entries:
             self.logger.warning("No PDF content to extract")
+            return
+
+        tasks = []
+        for item in entries:
+            try:
+                prepared = self.__prepare_item(item, overwrite)
+            except Exception as e:
+                self.logger.error("Error processing item: %s", e)
+                continue
+            if prepared:
+                tasks.append(
+                    asyncio.ensure_future(
+                        self.__download_paper_async(client, slots, *prepared, overwrite)
+                    )
+                )
+        await self.__collect_async(tasks)
+
+    async def __collect_async(self, tasks: List[asyncio.Future]) -> None:
+        """
+        Await download tasks, logging each failure as soon as it completes.
+        Pending downloads are cancelled when the query is aborted.
+
+        :param tasks: Download tasks of a single query
+        :raises PaperGeneralError: If downloads exceed query_timeout or more than max_failures fail
+        :logs: Error for each failed download
+        """
+        failures = 0
+        try:
+            for task in asyncio.as_completed(tasks, timeout=self.query_timeout):
+                try:
+                    await task
+                except asyncio.TimeoutError:
+                    raise
+                except Exception as e:
+                    failures = self.__record_failure(failures, e)
+        except asyncio.TimeoutError:
+            raise self.__timeout_error()
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Wait for cancelled tasks so none outlive the client they use.
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.to_thread(self.flush)
+
+    async def __download_all(
+        self, queries: List[Query], overwrite: Optional[bool] = False
+    ) -> None:
+        """
+        Fetch and process all queries concurrently over one async client.
+        PDF downloads of all queries share the client and at most
+        download_limit of them are in flight at once.
+
+        :param queries: List of Query objects with search parameters
+        :param overwrite: Whether to overwrite existing files
+        :raises httpx.HTTPError: If any API request fails
+        """
+        # Created per call: a semaphore is bound to the event loop it is used in.
+        slots = asyncio.Semaphore(self.download_limit)
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self.download_limit + len(queries),
+                max_keepalive_connections=self.download_limit,
+            ),
+            timeout=DEFAULT_TIMEOUT,
+        ) as client:
+            fetches = [
+                asyncio.ensure_future(self.__fetch_query(client, slots, query, overwrite))
+                for query in queries
+            ]
+            try:
+                await asyncio.gather(*fetches)
+            finally:
+                # A failed query must not leave the others running on a closed client.
+                for fetch in fetches:
+                    fetch.cancel()
+                await asyncio.gather(*fetches, return_exceptions=True)
 
     def download_papers(
         self, queries: List[Query], overwrite: Optional[bool] = False
     ) -> None:
         """
-        Request and process multiple arXiv queries sequentially.
+        Request and process multiple arXiv queries concurrently.
 
         :param queries: List of Query objects with search parameters
         :param overwrite: Whether to overwrite existing files
+        :raises PaperGeneralError: If any query fails
         :logs: Info about progress, debug for file paths
         """
-        self.logger.info(f"Getting papers. Quereies to process: {len(queries)}")
-        self.logger.debug(f"File download path: {self.download_path}")
+        self.logger.info("Getting papers. Quereies to process: %d", len(queries))
+        self.logger.debug("File download path: %s", self.download_path)
 
         try:
-            for query in queries:
-                self.fetch_and_process(query=query, overwrite=overwrite)
+            run_coroutine(self.__download_all(queries, overwrite))
             self.logger.info("Saved all papers as json files.")
         except Exception as e:
             raise PaperGeneralError(f"Failed to get papers: {e}")
 
+    def flush(self) -> None:
+        """
+        Block until all queued papers are written to disk.
+        """
+        self.__write_queue.join()
+
+    def close(self) -> None:
+        """
+        Shut down worker pools, the writer thread and HTTP connections.
+        Waits for pending downloads and writes to finish before returning.
+        """
+        self.executor.shutdown(wait=True)
+        self.pdf_executor.shutdown(wait=True)
+        with self.__writer_lock:
+            if self.__writer is not None and self.__writer.is_alive():
+                self.__stop_writer()
+                self.__writer.join()
+        self.client.close()
+        self.pdf_client.close()
+
+    def __enter__(self) -> "Arxiv":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Close the client when leaving a with block, see close().
+        """
+        self.close()
+
 
     async def read_papers(
         self, 
@@ -261,40 +682,74 @@ class Arxiv:
         """Fetch and yield papers content one by one from arXiv API.
         
         :param queries: List of Query objects with search parameters
-        :param prettify: Optional bool. If set to True, dumps dict to json with indent ==  4.
+        :param prettify: Optional bool. If set to True, dumps dict to json string indented with 2 spaces.
         :yields: Dictionary containing full paper metadata and content
         :raises: httpx.HTTPError: If API request fails
+        :note: All queries are requested up front; papers are still yielded in query order
+        """
+        self.logger.info("Reading papers. Queries to process: %d", len(queries))
+
+        async with httpx.AsyncClient(
+            http2=True, limits=self.limits, timeout=DEFAULT_TIMEOUT
+        ) as client:
+            fetches = [
+                asyncio.ensure_future(client.get(f"{self.base_url}{query.build()}"))
+                for query in queries
+            ]
+            try:
+                async for paper in self.__read_responses(queries, fetches, prettify):
+                    yield paper
+            finally:
+                for fetch in fetches:
+                    fetch.cancel()
+                await asyncio.gather(*fetches, return_exceptions=True)
+
+    async def __read_responses(
+        self,
+        queries: List[Query],
+        fetches: List[asyncio.Future],
+        prettify: Optional[bool] = False,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
         """
-        self.logger.info(f"Reading papers. Queries to process: {len(queries)}")
+        Yield papers of prefetched query responses in query order.
 
-        for query in queries:
+        :param queries: Query objects, in the order of fetches
+        :param fetches: Pending API responses, one per query
+        :param prettify: Whether to yield papers as indented json strings
+        :yields: Dictionary containing full paper metadata and content
+        :logs: Error for failed queries and papers, warning if no entries
+        """
+        for query, fetch in zip(queries, fetches):
             try:
-                response = self.client.get(f"{self.base_url}{query.build()}")
+                response = await fetch
                 response.raise_for_status()
-                embedded_data = xml_to_dict(response.text)
-                if "entry" not in embedded_data:
-                    self.logger.warning("No entries found for query")
-                    continue
-                entries = embedded_data.get("entry")
-                if not isinstance(entries, list):
-                    entries = [entries]  
-                for item in entries:
+                entries = 0
+                for item_summary in parse_arxiv_feed(response.content):
+                    entries += 1
                     try:
-                        item_summary = self.__get_raw(item)
                         pdf_link = self.extract_pdf_link(item_summary.get("links"))
                         if pdf_link:
-                            item_summary["content"] = clean_text(load_pdf_text(pdf_link))
-                            yield json.dumps(self.get(item_summary), indent=4) if prettify else self.get(item_summary)
+                            # Off the event loop, so the other queries keep downloading.
+                            await asyncio.get_running_loop().run_in_executor(
+                                self.pdf_executor, self.__load_content, item_summary, pdf_link
+                            )
+                            yield (
+                                orjson.dumps(item_summary, option=orjson.OPT_INDENT_2).decode()
+                                if prettify
+                                else item_summary
+                            )
                         else:
                             self.logger.warning(
-                                f"No PDF link for {item_summary.get('title')}"
+                                "No PDF link for %s", item_summary.get("title")
                             )
                     except Exception as e:
-                        self.logger.error(f"Error processing paper: {e}")
+                        self.logger.error("Error processing paper: %s", e)
                         continue  
+                if not entries:
+                    self.logger.warning("No entries found for query")
             except httpx.HTTPError as e:
-                self.logger.error(f"HTTP error for query {query}: {e}")
+                self.logger.error("HTTP error for query %s: %s", query, e)
                 continue
             except Exception as e:
-                self.logger.error(f"Unexpected error: {e}")
+                self.logger.error("Unexpected error: %s", e)
                 continue
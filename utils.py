@@ -8,34 +8,43 @@ This module provides helper functions for:
 - Text cleaning and normalization
 - File name sanitization
 - Data saving and loading
+- Cache index of already saved papers
 - Custom exception handling
+- Running coroutines from synchronous code
 
 The utilities support the main arXiv client operations by providing
 lower-level file and data processing capabilities.
 
 Constants:
     DEFAULT_ARXIV_DIR: Default directory for paper storage
+    ATOM_NAMESPACE: Namespace prefix of Atom elements in ElementTree tags
+    ARXIV_NAMESPACE: Namespace prefix of arXiv extension elements in ElementTree tags
+    ATOM_ENTRY_TAG: Namespaced tag of a single paper entry in arXiv Atom feeds
+    CACHE_INDEX_FILE: Name of the file listing ids and file names of already saved papers
     INVALID_FILENAME_CHARS: Mapping of invalid characters for filenames
 
 Dependencies:
     - httpx: For HTTP requests
-    - pypdf: For PDF processing
+    - PyMuPDF (fitz): For PDF processing
+    - orjson: For fast JSON serialization
     - pathlib: For path operations
     - xml.etree: For XML parsing
 """
 
-import os
-import json
+import re
+import fitz
 import httpx
+import orjson
+import asyncio
 import logging
 from io import BytesIO
 from uuid import uuid4
 from pathlib import Path
-from pypdf import PdfReader
 from datetime import datetime
 from urllib.parse import urlparse
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, Final, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, Dict, Final, Iterator, List, Optional
 from .custom_exceptions import PDFDownloadError, XMLParsingError
 
 
@@ -44,6 +53,12 @@ logging.getLogger("httpcore").setLevel(logging.ERROR)
 
 
 DEFAULT_ARXIV_DIR: Final[str] = "ArxivPapers"
+# Resolved once; posix_path and check_path build on it instead of __file__.
+_MODULE_DIR: Final[Path] = Path(__file__).resolve().parent
+ATOM_NAMESPACE: Final[str] = "{http://www.w3.org/2005/Atom}"
+ARXIV_NAMESPACE: Final[str] = "{http://arxiv.org/schemas/atom}"
+ATOM_ENTRY_TAG: Final[str] = f"{ATOM_NAMESPACE}entry"
+CACHE_INDEX_FILE: Final[str] = ".arxiv_index"
 INVALID_FILENAME_CHARS: Final[Dict] = {
     " ": "_",
     ":": "",
@@ -60,14 +75,26 @@ INVALID_FILENAME_CHARS: Final[Dict] = {
     "!": "",
     "__": "_",
 }
-CHAR_REPLACEMENTS: Final[List[tuple]] = [
-    ("\n", " "),
-    ("\t", " "),
-    ("\n\n", " "),
-    ("\t\t", " "),
-    ("  ", " "),
-    ("#text", ""),
-]
+# Single-character replacements applied in one C-level pass by str.translate;
+# multi-character entries are covered by dropping "\n" and collapsing "_" runs.
+_FILENAME_TABLE: Final[Dict[int, str]] = str.maketrans(
+    {char: repl for char, repl in INVALID_FILENAME_CHARS.items() if len(char) == 1}
+)
+_UNDERSCORE_RUN: Final[re.Pattern] = re.compile(r"__+")
+_ATOM_AUTHOR: Final[str] = f"{ATOM_NAMESPACE}author"
+_ATOM_NAME: Final[str] = f"{ATOM_NAMESPACE}name"
+_ATOM_LINK: Final[str] = f"{ATOM_NAMESPACE}link"
+_ATOM_CATEGORY: Final[str] = f"{ATOM_NAMESPACE}category"
+_ARXIV_PRIMARY_CATEGORY: Final[str] = f"{ARXIV_NAMESPACE}primary_category"
+# Entry children whose text is copied as is, by tag.
+_ATOM_TEXT_FIELDS: Final[Dict[str, str]] = {
+    f"{ATOM_NAMESPACE}{name}": name
+    for name in ("id", "updated", "published", "title", "summary")
+}
+# Namespaced tag -> local name, filled by _local_name.
+_LOCAL_NAMES: Final[Dict[str, str]] = {}
+# Whitespace runs and single tabs/newlines, each replaced by one space.
+_WHITESPACE_RUN: Final[re.Pattern] = re.compile(r"\s{2,}|[\t\n]")
 
 
 def clean_filename(text: str) -> str:
@@ -79,9 +106,7 @@ def clean_filename(text: str) -> str:
     """
     if not text or not isinstance(text, str):
         return str(uuid4().hex)
-    for char, replacement in INVALID_FILENAME_CHARS.items():
-        text = text.replace(char, replacement)
-    return text
+    return _UNDERSCORE_RUN.sub("_", text.translate(_FILENAME_TABLE))
 
 
 def clean_text(text: str) -> str | Any:
@@ -93,9 +118,7 @@ def clean_text(text: str) -> str | Any:
     """
     if not text or not isinstance(text, str):
         return text
-    for old, new in CHAR_REPLACEMENTS:
-        text = text.replace(old, new)
-    return text.strip()
+    return _WHITESPACE_RUN.sub(" ", text.replace("#text", "")).strip()
 
 
 def clean_paper_chunk(text: str) -> str | Any:
@@ -110,6 +133,24 @@ def clean_paper_chunk(text: str) -> str | Any:
     return text.replace(r"\\n", "\n").replace(r"\\t", "\t")
 
 
+def clean_paper_text(text: str) -> str | Any:
+    """
+    Clean a full paper text in one go: unescape like clean_paper_chunk, then
+    normalize like clean_text. Every whitespace run, including escaped newlines and
+    tabs, becomes a single space.
+
+    :param text: (str) Extracted paper text
+    :returns: Cleaned text string if provided data is string, or Any otherwise
+    :note: str.split() collapses whitespace in C, about twice as fast as chaining
+        clean_paper_chunk and clean_text on large texts
+    """
+    if not text or not isinstance(text, str):
+        return text
+    return " ".join(
+        text.replace("#text", "").replace(r"\\n", " ").replace(r"\\t", " ").split()
+    )
+
+
 def posix_path(path_: str = None) -> str:
     """
     Convert Windows path to POSIX-style absolute path.
@@ -119,10 +160,8 @@ def posix_path(path_: str = None) -> str:
     :raises TypeError: If path_ is not str or Path object
     """
     if path_ and isinstance(path_, (Path | str)):
-        return Path(
-            os.path.abspath(os.path.join(os.path.dirname(__file__), path_))
-        ).as_posix()
-    return Path(os.path.abspath(os.path.join(os.path.dirname(__file__)))).as_posix()
+        return (_MODULE_DIR / path_).resolve().as_posix()
+    return _MODULE_DIR.as_posix()
 
 
 def check_path(path: str = "ArxivPapers") -> Path:
@@ -134,24 +173,14 @@ def check_path(path: str = "ArxivPapers") -> Path:
     :raises OSError: If directory creation fails
     """
     try:
-        abs_path = os.path.abspath(path)
-        posix_abs_path = posix_path(abs_path)
-
-        if os.path.exists(posix_abs_path):
-            return Path(posix_abs_path)
-
+        abs_path = Path(path).resolve()
         try:
-            os.makedirs(posix_abs_path, mode=0o755)
-            return Path(posix_abs_path)
-        except OSError as e:
-            default_path = os.path.join(os.path.dirname(__file__), DEFAULT_ARXIV_DIR)
-            default_posix_path = posix_path(default_path)
-            
-            if os.path.exists(default_posix_path):
-                return Path(default_posix_path)
-                
-            os.makedirs(default_posix_path, mode=0o755)
-            return Path(default_posix_path)
+            abs_path.mkdir(mode=0o755, parents=True, exist_ok=True)
+            return abs_path
+        except OSError:
+            default_path = _MODULE_DIR / DEFAULT_ARXIV_DIR
+            default_path.mkdir(mode=0o755, parents=True, exist_ok=True)
+            return default_path
 
     except Exception as e:
         raise OSError(f"Path operation failed: {e}")
@@ -185,12 +214,29 @@ def non_empty_check(
         raise ValueError(f"{name} cannot be empty")
 
 
+def run_coroutine(coroutine: Coroutine) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    :param coroutine: Coroutine to execute
+    :returns: Coroutine result
+    :note: Inside a running event loop the coroutine is run on a helper thread,
+        since asyncio.run cannot be nested
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as runner:
+        return runner.submit(asyncio.run, coroutine).result()
+
+
 def save_to_file(
     data: dict,
     file_name: str,
     path: str = "ArxivPapers",
     add_timestamp: Optional[bool] = False,
-) -> None:
+) -> Path:
     """
     Save data to JSON file.
 
@@ -198,6 +244,7 @@ def save_to_file(
     :param file_name: Target filename
     :param path: Directory path
     :param add_timestamp: Whether to add timestamp to filename
+    :returns: Path of the written file
     :raises OSError: If file cannot be written
     """
     if not file_name:
@@ -205,49 +252,182 @@ def save_to_file(
     try:
         file_name = clean_filename(file_name)
         if add_timestamp:
-            file_path = f"{path}/{file_name}_{create_timestamp()}.json"
-        else:
-            file_path = f"{path}/{file_name}.json"
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+            file_name = f"{file_name}_{create_timestamp()}"
+        file_path = Path(path, f"{file_name}.json")
+        file_path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return file_path
     except Exception as e:
         raise OSError(f"Could not save file: {e}")
 
 
-def xml_to_dict(xml_data: str) -> dict:
+def load_cache_index(path: str | Path) -> Dict[str, Optional[str]]:
     """
-    Convert XML string to dictionary representation.
-
-    :param xml_data: (str) XML string to parse
-    :returns: Dictionary representation of XML
-    :raise XMLParsingError: If XML parsing fails
-    :raise ValueError: If input is empty or invalid
+    Load ids and file names of papers already saved in a download directory.
+    Each index line holds an arXiv id and the saved file name, separated by a tab.
+    Later lines win, so a paper saved again points to its newest file.
+
+    :param path: Directory holding saved papers
+    :returns: Mapping of arXiv id to saved file name, empty if there is no index.
+        The file name is None for lines written without one.
+    :raises OSError: If the index exists but cannot be read
     """
+    index = {}
     try:
-        result = {}
-        element = ET.fromstring(xml_data.strip())
+        with open(Path(path) / CACHE_INDEX_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                paper_id, _, file_name = line.strip().partition("\t")
+                if paper_id:
+                    index[paper_id] = file_name or None
+    except FileNotFoundError:
+        pass
+    return index
 
-        if element.attrib:
-            result.update({f"@{key}": value for key, value in element.attrib.items()})
 
-        for child in element:
+def append_cache_index(path: str | Path, paper_id: str, file_name: str) -> None:
+    """
+    Record a saved paper in the cache index of a download directory.
+
+    :param path: Directory holding saved papers
+    :param paper_id: arXiv id of the saved paper
+    :param file_name: Name of the saved file inside path
+    :raises OSError: If the index cannot be written
+    """
+    with open(Path(path) / CACHE_INDEX_FILE, "a", encoding="utf-8") as f:
+        f.write(f"{paper_id}\t{file_name}\n")
+
+
+def _local_name(tag: str) -> str:
+    """
+    Return a tag without its XML namespace, caching the result per tag.
+    Feeds only use a handful of distinct tags, so the cache stays tiny.
+    """
+    name = _LOCAL_NAMES.get(tag)
+    if name is None:
+        name = _LOCAL_NAMES[tag] = tag.rpartition("}")[2]
+    return name
+
+
+def xml_to_dict(xml_data: str | bytes) -> dict:
+    """
+    Convert XML string or raw response bytes to dictionary representation.
+    Built in a single streaming pass: attributes are stored as '@name', children under
+    their tag without namespace (repeated tags become lists) and non-empty text as '#text'.
+
+    :param xml_data: (str | bytes) XML document to parse
+    :returns: Dictionary representation of XML
+    :raise XMLParsingError: If XML parsing fails or input is empty
+    """
+    if isinstance(xml_data, str):
+        xml_data = xml_data.encode("utf-8")
+    # stack[0] collects the root element; stack[-1] is the element being built.
+    stack = [{}]
+    try:
+        for event, element in ET.iterparse(
+            BytesIO(xml_data.strip()), events=("start", "end")
+        ):
+            if event == "start":
+                stack.append({f"@{key}": value for key, value in element.attrib.items()})
+                continue
+
+            node = stack.pop()
+            if element.text and element.text.strip():
+                node["#text"] = element.text.strip()
+
+            parent = stack[-1]
             # Remove XML namespace if present
-            tag = child.tag.split("}")[-1]
-            try:
-                child_dict = xml_to_dict(ET.tostring(child, encoding="unicode"))
-            except ET.ParseError as e:
-                raise XMLParsingError(f"Failed to parse child element '{tag}: {e}")
-
-            if tag in result:
-                if not isinstance(result[tag], list):
-                    result[tag] = [result[tag]]
-                result[tag].append(child_dict)
+            name = _local_name(element.tag)
+            if name in parent:
+                if not isinstance(parent[name], list):
+                    parent[name] = [parent[name]]
+                parent[name].append(node)
             else:
-                result[tag] = child_dict
+                parent[name] = node
+            # Element is fully converted, release its text and subtree.
+            element.clear()
+    except ET.ParseError as e:
+        raise XMLParsingError(f"Failed to parse XML data: {e}")
+    except Exception as e:
+        raise XMLParsingError(f"Unexpected error processing XML: {e}")
+
+    root = next(iter(stack[0].values()), None)
+    if root is None:
+        raise XMLParsingError("Failed to parse XML data: no root element")
+    return root
+
 
-        if element.text and element.text.strip():
-            result["#text"] = element.text.strip()
-        return result
+def _element_text(element: Optional[ET.Element]) -> Optional[str]:
+    """
+    Return the stripped text of an element, or None if it has no text.
+    """
+    if element is None or not element.text:
+        return None
+    return element.text.strip() or None
+
+
+def _parse_entry(entry: ET.Element) -> dict:
+    """
+    Map a single Atom entry element straight to the final paper structure.
+
+    :param entry: (ET.Element) Completely parsed <entry> element
+    :returns: Dictionary with cleaned title and "content" set to None
+    """
+    paper = {
+        "id": None,
+        "updated": None,
+        "published": None,
+        "title": None,
+        "summary": None,
+        "author": [],
+        "links": [],
+        "category": [],
+        "primary_category": None,
+        "content": None,
+    }
+    categories = {}
+    # One pass over the children; the schema is fixed, so every tag is known.
+    for child in entry:
+        name = child.tag
+        if name == _ATOM_AUTHOR:
+            author = _element_text(child.find(_ATOM_NAME))
+            if author:
+                paper["author"].append(author)
+        elif name == _ATOM_LINK:
+            paper["links"].append(
+                {"href": child.get("href"), "rel": child.get("rel"), "type": child.get("type")}
+            )
+        elif name == _ATOM_CATEGORY:
+            term = child.get("term")
+            if term:
+                categories[term] = None
+        elif name == _ARXIV_PRIMARY_CATEGORY:
+            paper["primary_category"] = child.get("term")
+        elif name in _ATOM_TEXT_FIELDS:
+            paper[_ATOM_TEXT_FIELDS[name]] = _element_text(child)
+    paper["title"] = clean_text(paper["title"])
+    paper["category"] = list(categories)
+    return paper
+
+
+def parse_arxiv_feed(xml_data: str | bytes) -> Iterator[dict]:
+    """
+    Lazily yield papers of an arXiv Atom feed in their final structure.
+    Unlike xml_to_dict, no generic dictionaries are built: the known child tags of
+    each entry are read directly, so the result needs no further unwrapping.
+
+    :param xml_data: (str | bytes) Atom feed returned by the arXiv API
+    :yields: Paper metadata with id, updated, published, title, summary, author,
+        links, category, primary_category and "content" set to None
+    :raise XMLParsingError: If XML parsing fails
+    """
+    if isinstance(xml_data, str):
+        xml_data = xml_data.encode("utf-8")
+    try:
+        for _, element in ET.iterparse(BytesIO(xml_data.strip()), events=("end",)):
+            if element.tag == ATOM_ENTRY_TAG:
+                yield _parse_entry(element)
+                element.clear()
     except ET.ParseError as e:
         raise XMLParsingError(f"Failed to parse XML data: {e}")
     except Exception as e:
@@ -265,17 +445,16 @@ def extract_authors(author: Optional[Dict | List[Dict]]) -> List[str]:
     if not author:
         return []
 
-    if not isinstance(author, (dict, list)):
-        raise TypeError(f"Expected dict or list, got {type(author)}")
-
     # Handle single author
     if isinstance(author, dict):
         name = author.get("name", {}).get("#text")
         return [name] if name else []
 
+    if not isinstance(author, list):
+        raise TypeError(f"Expected dict or list, got {type(author)}")
+
     # Handle list of authors
-    names = [person.get("name", {}).get("#text") for person in author]
-    return list(filter(None, names))
+    return [name for person in author if (name := person.get("name", {}).get("#text"))]
 
 
 def extract_links(link: Optional[Dict | List[Dict]]) -> List[Dict[str, Optional[str]]]:
@@ -289,9 +468,6 @@ def extract_links(link: Optional[Dict | List[Dict]]) -> List[Dict[str, Optional[
     if not link:
         return []
 
-    if not isinstance(link, (dict, list)):
-        raise TypeError(f"Expected dict or list, got {type(link)}")
-
     # Handle single link
     if isinstance(link, dict):
         return [
@@ -302,6 +478,9 @@ def extract_links(link: Optional[Dict | List[Dict]]) -> List[Dict[str, Optional[
             }
         ]
 
+    if not isinstance(link, list):
+        raise TypeError(f"Expected dict or list, got {type(link)}")
+
     # Handle list of links using list comprehension
     return [
         {"href": url.get("@href"), "rel": url.get("@rel"), "type": url.get("@type")}
@@ -321,15 +500,19 @@ def extract_category(category: Dict | List[Dict]) -> List[str]:
     if not category:
         return []
 
-    if not isinstance(category, (dict, list)):
-        raise TypeError(f"Expected dict or list, got {type(category)}")
-
     if isinstance(category, dict):
         term = category.get("@term")
         return [term] if term else []
 
-    terms = [entry.get("@term") for entry in category if entry]
-    return list(set(filter(None, terms)))
+    if not isinstance(category, list):
+        raise TypeError(f"Expected dict or list, got {type(category)}")
+
+    # dict.fromkeys drops duplicates and, unlike a set, keeps the feed order.
+    return list(
+        dict.fromkeys(
+            term for entry in category if entry and (term := entry.get("@term"))
+        )
+    )
 
 
 def extract_primary_category(
@@ -350,12 +533,53 @@ def extract_primary_category(
     return primary_category.get("@term")
 
 
-def load_pdf_text(url: str, timeout: float = 30.0) -> Optional[str]:
+def extract_pdf_text(
+    pdf_data: bytes, url: Optional[str] = None, normalize: bool = False
+) -> str:
+    """
+    Extract text content from a downloaded PDF.
+
+    :param pdf_data: (bytes) Raw PDF document
+    :param url: (str, optional) Source URL of the PDF, used in error messages
+    :param normalize: (bool) Collapse all whitespace with clean_paper_text instead of
+        only unescaping it with clean_paper_chunk
+    :returns: Extracted text content
+    :raise PDFDownloadError: If the PDF cannot be parsed or contains no text
+    """
+    try:
+        document = fitz.open(stream=pdf_data, filetype="pdf")
+    except Exception as e:
+        raise PDFDownloadError(f"Error processing PDF from {url}: {e}")
+    try:
+        if not document.page_count:
+            raise PDFDownloadError(f"No pages found in PDF from {url}")
+        # Extract each page once; MuPDF does the parsing in C. A document must not
+        # be shared between threads, so papers are parallelized, not pages.
+        text = "".join([page.get_text("text") for page in document])
+    finally:
+        document.close()
+
+    # One pass over the joined text instead of one per page.
+    text = clean_paper_text(text) if normalize else clean_paper_chunk(text)
+    if not text or not text.strip():
+        raise PDFDownloadError(f"No text content extracted from {url}")
+    return text
+
+
+def load_pdf_text(
+    url: str,
+    timeout: float = 30.0,
+    client: Optional[httpx.Client] = None,
+    normalize: bool = False,
+) -> Optional[str]:
     """
     Download and extract text content from a PDF URL.
 
     :param url: (str) URL of the PDF to download and process
     :param timeout: (float) Request timeout in seconds, 30 seconds by default
+    :param client: (httpx.Client, optional) Shared client whose connection pool is reused
+        across calls. If None, a temporary client is created and closed afterwards.
+    :param normalize: (bool) Collapse all whitespace, see extract_pdf_text
     :param silent_error: (bool) Whether to return None on errors instead of raising
     :returns: Extracted text content or None if extraction fails and silent_error=True
     :raise ValueError: If URL is invalid
@@ -364,26 +588,21 @@ def load_pdf_text(url: str, timeout: float = 30.0) -> Optional[str]:
     """
     if not url or not urlparse(url).scheme:
         raise ValueError(f"Invalid URL: {url}")
-    try:
+    owns_client = client is None
+    if owns_client:
         client = httpx.Client(timeout=timeout)
-        with client:
-            response = client.get(url, follow_redirects=True)
-            response.raise_for_status()
-            pdf_reader = PdfReader(BytesIO(response.content))
-            if not pdf_reader.pages:
-                raise PDFDownloadError(f"No pages found in PDF from {url}")
-
-            text = "".join(
-                clean_paper_chunk(page.extract_text())
-                for page in pdf_reader.pages
-                if page.extract_text()  # Skip empty pages
-            )
-            if not text.strip():
-                raise PDFDownloadError(f"No text content extracted from {url}")
-            return text
+    try:
+        # fitz needs the complete document in memory, so there is nothing to gain
+        # from streaming the body.
+        response = client.get(url, follow_redirects=True, timeout=timeout)
+        response.raise_for_status()
+        return extract_pdf_text(response.content, url, normalize)
     except httpx.TimeoutException as e:
         raise PDFDownloadError(f"Timeout downloading PDF from {url}: {e}")
     except httpx.HTTPError as e:
         raise PDFDownloadError(f"HTTP error downloading PDF from {url}: {e}")
     except Exception as e:
         raise PDFDownloadError(f"Error processing PDF from {url}: {e}")
+    finally:
+        if owns_client:
+            client.close()